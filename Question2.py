@@ -9,33 +9,30 @@ import numpy as np
 import pandas as pd
 
 # Set seed for reproducibility
-np.random.seed(42)
+rng = np.random.default_rng(42)  # PCG64 generator
 
 # Number of participants and days
 num_participants = 15
 num_days = 14
 
 # Step 1: Randomly assign fitness levels (0 = Low, 1 = Moderate, 2 = High)
-fitness_levels = np.random.choice([0, 1, 2], size=num_participants)
+fitness_levels = rng.choice(3, size=num_participants)
 
 # Step 2: Define means and standard deviations for each fitness level
-fitness_params = {
-    0: {'mean': 6000, 'std': 600},
-    1: {'mean': 7500, 'std': 500},
-    2: {'mean': 9000, 'std': 700}
-}
+level_means = np.array([6000, 7500, 9000])
+level_stds = np.array([600, 500, 700])
 
 # Step 2-4: Generate step counts based on fitness level
-step_counts = np.zeros((num_participants, num_days), dtype=int)
-
-for i, level in enumerate(fitness_levels):
-    mean = fitness_params[level]['mean']
-    std = fitness_params[level]['std']
-    # Generate step counts and apply rounding and clipping
-    steps = np.random.normal(loc=mean, scale=std, size=num_days)
-    steps = np.round(steps).astype(int)
-    steps = np.clip(steps, 3000, 15000)
-    step_counts[i] = steps
+# Broadcast each participant's mean/std across their row and draw all days at once
+means = level_means[fitness_levels][:, None]
+stds = level_stds[fitness_levels][:, None]
+# Scale, shift, round and clip in place in one float buffer
+steps = rng.standard_normal((num_participants, num_days))
+np.multiply(steps, stds, out=steps)
+np.add(steps, means, out=steps)
+np.rint(steps, out=steps)
+np.clip(steps, 3000, 15000, out=steps)
+step_counts = steps.astype(np.int32)
 
 # Convert fitness levels to a DataFrame for display
 fitness_levels_df = pd.DataFrame({
@@ -43,10 +40,11 @@ fitness_levels_df = pd.DataFrame({
     'Fitness_Level': fitness_levels
 })
 
-# Convert step counts to DataFrame
+# Convert step counts to DataFrame (display only; analysis uses the raw array)
+participant_ids = np.array([f'P{i+1}' for i in range(num_participants)])
 step_counts_df = pd.DataFrame(
     step_counts,
-    index=[f'P{i+1}' for i in range(num_participants)],
+    index=participant_ids,
     columns=[f'Day_{j+1}' for j in range(num_days)]
 )
 
@@ -62,28 +60,40 @@ print(step_counts_df)
 # ----------------------------
 
 # (a) Average daily steps per participant
-avg_daily_steps = step_counts_df.mean(axis=1)
-avg_sorted = avg_daily_steps.sort_values(ascending=False)
+avg_daily_steps = step_counts.mean(axis=1)
+# Partial selection of the cutoff value, then order just the top entries;
+# ties (including at the cutoff) keep participant order
+top_n = min(5, num_participants)
+cutoff = avg_daily_steps[np.argpartition(-avg_daily_steps, top_n - 1)[top_n - 1]]
+above = np.flatnonzero(avg_daily_steps > cutoff)
+tied = np.flatnonzero(avg_daily_steps == cutoff)[:top_n - above.size]
+top5_idx = np.sort(np.concatenate([above, tied]))
+top5_idx = top5_idx[np.argsort(-avg_daily_steps[top5_idx], kind='stable')]
 
 print("\n(a) Top 5 Participants by Average Daily Steps:")
-top5 = avg_sorted.head(5)
-for participant, avg in top5.items():
+for participant, avg in zip(participant_ids[top5_idx], avg_daily_steps[top5_idx]):
     print(f"{participant}: {avg:.0f} steps")
 
 # (b) Overall mean and standard deviation (rounded)
-overall_mean = np.round(step_counts_df.values.mean())
-overall_std = np.round(step_counts_df.values.std())
+# Accumulate sum and sum of squares in int64, then derive both statistics
+n = step_counts.size
+s = step_counts.sum(dtype=np.int64)
+ss = np.square(step_counts, dtype=np.int64).sum()
+mean = s / n
+overall_mean = np.round(mean)
+overall_std = np.round(np.sqrt(ss / n - mean * mean))
 
 print(f"\n(b) Overall Mean of All Steps: {overall_mean:.0f}")
 print(f"Overall Standard Deviation of All Steps: {overall_std:.0f}")
 
 # (c) Median daily steps per participant
-median_daily_steps = step_counts_df.median(axis=1)
+median_daily_steps = np.median(step_counts, axis=1)
 highest_median = median_daily_steps.max()
 lowest_median = median_daily_steps.min()
 
-highest_participant = median_daily_steps[median_daily_steps == highest_median].index.tolist()
-lowest_participant = median_daily_steps[median_daily_steps == lowest_median].index.tolist()
+# Positions of every participant tied at the extreme, mapped back to labels
+highest_participant = participant_ids[np.flatnonzero(median_daily_steps == highest_median)]
+lowest_participant = participant_ids[np.flatnonzero(median_daily_steps == lowest_median)]
 
 print("\n(c) Participant(s) with Highest Median Daily Steps:")
 for p in highest_participant:
@@ -94,11 +104,18 @@ for p in lowest_participant:
     print(f"{p}: {lowest_median:.0f} steps")
 
 # (d) Count how many participants have an average above 8000
-above_8000 = (avg_daily_steps > 8000).sum()
+above_8000 = np.count_nonzero(avg_daily_steps > 8000)
 print(f"\n(d) Number of Participants with Average Daily Steps > 8000: {above_8000}")
 
 # (e) Percentiles (25th, 50th, 75th)
-percentiles = np.percentile(step_counts_df.values, [25, 50, 75])
+# Partition once around the neighbouring ranks and interpolate linearly,
+# matching np.percentile's default method without a full sort
+flat = step_counts.flatten()  # copy: partition works in place
+pos = np.array([25, 50, 75]) / 100 * (flat.size - 1)
+lo = np.floor(pos).astype(np.intp)
+hi = np.ceil(pos).astype(np.intp)
+flat.partition(np.unique(np.concatenate([lo, hi])))
+percentiles = flat[lo] + (flat[hi] - flat[lo]) * (pos - lo)
 print("\n(e) Step Count Percentiles (All Data Combined):")
 print(f"25th Percentile: {percentiles[0]:.0f}")
 print(f"50th Percentile (Median): {percentiles[1]:.0f}")
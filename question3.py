@@ -2,6 +2,53 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to NumPy bincount
+    njit = None
+
+
+def _age_bin_means_numpy(age_bin, inc_code, hours, n_bins, n_groups):
+    """Mean hours and row counts per (income group, age bin) using np.bincount"""
+    valid = (age_bin >= 0) & (age_bin < n_bins) & (inc_code >= 0) & (inc_code < n_groups)
+    cell = inc_code[valid] * n_bins + age_bin[valid]
+    sums = np.bincount(cell, weights=hours[valid], minlength=n_groups * n_bins)
+    counts = np.bincount(cell, minlength=n_groups * n_bins)
+    means = np.divide(sums, counts, out=np.full(sums.shape, np.nan), where=counts > 0)
+    return means.reshape(n_groups, n_bins), counts.reshape(n_groups, n_bins)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _age_bin_means_numba(age_bin, inc_code, hours, n_bins, n_groups):
+        """Mean hours and row counts per (income group, age bin) in one sequential scan"""
+        sums = np.zeros((n_groups, n_bins))
+        counts = np.zeros((n_groups, n_bins), np.int64)
+        for i in range(hours.size):
+            b = age_bin[i]
+            g = inc_code[i]
+            if 0 <= b < n_bins and 0 <= g < n_groups:
+                sums[g, b] += hours[i]
+                counts[g, b] += 1
+        means = np.full((n_groups, n_bins), np.nan)
+        for g in range(n_groups):
+            for b in range(n_bins):
+                if counts[g, b] > 0:
+                    means[g, b] = sums[g, b] / counts[g, b]
+        return means, counts
+else:
+    _age_bin_means_numba = None
+
+
+def _age_bin_means(age_bin, inc_code, hours, n_bins, n_groups):
+    """Mean hours and row counts per (income group, age bin), via Numba when available"""
+    # Both paths need integer indices; float bin ids (e.g. from imputed ages) are floored
+    age_bin = np.floor(np.asarray(age_bin)).astype(np.intp)
+    inc_code = np.asarray(inc_code).astype(np.intp)
+    hours = np.asarray(hours, dtype=np.float64)
+    kernel = _age_bin_means_numba if _age_bin_means_numba is not None else _age_bin_means_numpy
+    return kernel(age_bin, inc_code, hours, n_bins, n_groups)
+
 
 class AdultDataAnalyzer:
     def __init__(self, file_path):
@@ -47,6 +94,14 @@ class AdultDataAnalyzer:
             if col not in [v for variants in possible_names.values() for v in variants]:
                 self.column_mapping[col] = col
 
+        # Resolve the columns used by the chart builders once
+        self._c_sex = self.get_column_name('sex')
+        self._c_income = self.get_column_name('income')
+        self._c_age = self.get_column_name('age')
+        self._c_hours_per_week = self.get_column_name('hours_per_week')
+        self._c_occupation = self.get_column_name('occupation')
+        self._c_education_num = self.get_column_name('education_num')
+
     def get_column_name(self, standard_name):
         """Get the actual column name from standardized name"""
         return self.column_mapping.get(standard_name, standard_name)
@@ -54,8 +109,12 @@ class AdultDataAnalyzer:
     def load_and_clean_data(self):
         """Load dataset and perform data cleaning"""
         try:
-            # Load dataset
-            self.data = pd.read_csv(self.file_path)
+            # Load dataset, parsing '?' as missing and low-cardinality text as categoricals
+            categorical_columns = ['workclass', 'education', 'marital-status', 'marital_status',
+                                   'marital.status', 'occupation', 'relationship', 'race', 'sex',
+                                   'native-country', 'native_country', 'native.country', 'income']
+            self.data = pd.read_csv(self.file_path, na_values=['?'], skipinitialspace=True,
+                                    dtype={col: 'category' for col in categorical_columns})
 
             print("Original columns in dataset:")
             print(self.data.columns.tolist())
@@ -71,6 +130,7 @@ class AdultDataAnalyzer:
             # Data cleaning
             self._handle_missing_values()
             self._remove_duplicates()
+            self._encode_categories()
 
             print("Cleaned Dataset Info:")
             print(self.data.info())
@@ -84,28 +144,27 @@ class AdultDataAnalyzer:
             raise
 
     def _handle_missing_values(self):
-        """Handle missing values represented by '?'"""
-        # Count missing values before cleaning
-        missing_before = (self.data == '?').sum().sum()
-        print(f"Missing values ('?') found: {missing_before}")
-
-        # Replace '?' with NaN
-        self.data.replace('?', pd.NA, inplace=True)
+        """Handle missing values ('?' placeholders and blank cells)"""
+        # '?' placeholders and pandas' default NA markers are parsed by read_csv
+        missing_before = self.data.isna().sum().sum()
+        print(f"Missing values found: {missing_before}")
 
         # Impute categorical variables with mode
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
-            if self.data[col].isna().any():
-                mode_value = self.data[col].mode()[0]
-                self.data[col].fillna(mode_value, inplace=True)
+        categorical = self.data.select_dtypes(include=['object', 'category'])
+        categorical = categorical.loc[:, categorical.isna().any()]
+        if not categorical.empty:
+            modes = categorical.mode().iloc[0]
+            self.data[categorical.columns] = categorical.fillna(modes)
+            for col, mode_value in modes.items():
                 print(f"Imputed categorical column '{col}' with mode: {mode_value}")
 
         # Impute numerical variables with median
-        numerical_cols = self.data.select_dtypes(include=['number']).columns
-        for col in numerical_cols:
-            if self.data[col].isna().any():
-                median_value = self.data[col].median()
-                self.data[col].fillna(median_value, inplace=True)
+        numerical = self.data.select_dtypes(include=['number'])
+        numerical = numerical.loc[:, numerical.isna().any()]
+        if not numerical.empty:
+            medians = numerical.median()
+            self.data[numerical.columns] = numerical.fillna(medians)
+            for col, median_value in medians.items():
                 print(f"Imputed numerical column '{col}' with median: {median_value:.2f}")
 
     def _remove_duplicates(self):
@@ -115,19 +174,34 @@ class AdultDataAnalyzer:
         duplicates_after = self.data.duplicated().sum()
         print(f"Removed {duplicates_before - duplicates_after} duplicate records")
 
+    def _encode_categories(self):
+        """Encode income and sex as int8 codes shared by the chart builders"""
+        # Levels come from the observed values so no spelling is dropped; only NA is coded -1
+        self.income_levels = sorted(self.data[self._c_income].dropna().unique())
+        self.sex_levels = sorted(self.data[self._c_sex].dropna().unique())
+        self._income_code = pd.Categorical(self.data[self._c_income],
+                                           categories=self.income_levels).codes
+        self._sex_code = pd.Categorical(self.data[self._c_sex],
+                                        categories=self.sex_levels).codes
+
+    def _income_mask(self, level):
+        """Boolean row mask for one income level (all False if the level is absent)"""
+        if level not in self.income_levels:
+            return np.zeros(len(self._income_code), dtype=bool)
+        return self._income_code == self.income_levels.index(level)
+
     def create_visualizations(self):
         """Create the 2x2 grid of visualizations"""
         try:
-            fig, axs = plt.subplots(2, 2, figsize=(16, 12))
+            fig, axs = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
             fig.suptitle('Comprehensive Analysis of Adult Income Dataset',
-                         fontsize=16, fontweight='bold', y=0.98)
+                         fontsize=16, fontweight='bold')
 
             self._create_stacked_bar_chart(axs[0, 0])
             self._create_line_graph(axs[0, 1])
             self._create_histogram(axs[1, 0])
             self._create_grouped_bar_chart(axs[1, 1])
 
-            plt.tight_layout(rect=[0, 0, 1, 0.96])
             plt.show()
 
         except Exception as e:
@@ -137,10 +211,13 @@ class AdultDataAnalyzer:
     def _create_stacked_bar_chart(self, ax):
         """Create stacked bar chart for gender and income distribution"""
         try:
-            gender_col = self.get_column_name('sex')
-            income_col = self.get_column_name('income')
-
-            income_gender = self.data.groupby([gender_col, income_col]).size().unstack()
+            # Count each (sex, income) pair from the int8 codes in one bincount
+            n_income = len(self.income_levels)
+            valid = (self._sex_code >= 0) & (self._income_code >= 0)
+            pair = self._sex_code[valid].astype(np.intp) * n_income + self._income_code[valid]
+            counts = np.bincount(pair, minlength=len(self.sex_levels) * n_income)
+            income_gender = pd.DataFrame(counts.reshape(len(self.sex_levels), n_income),
+                                         index=self.sex_levels, columns=self.income_levels)
 
             income_gender.plot(kind='bar', stacked=True, ax=ax,
                                color=[self.colors['<=50K'], self.colors['>50K']],
@@ -164,16 +241,26 @@ class AdultDataAnalyzer:
     def _create_line_graph(self, ax):
         """Create line graph for age vs hours worked by income"""
         try:
-            age_col = self.get_column_name('age')
-            income_col = self.get_column_name('income')
-            hours_col = self.get_column_name('hours_per_week')
-
-            # Create age groups for better visualization
-            self.data['age_group'] = pd.cut(self.data[age_col],
-                                            bins=range(15, 100, 5),
-                                            labels=[f'{i}-{i + 4}' for i in range(15, 95, 5)])
-
-            age_hours = self.data.groupby(['age_group', income_col])[hours_col].mean().unstack()
+            age_col = self._c_age
+            hours_col = self._c_hours_per_week
+
+            # Create 5-year age groups as integer bin ids for better visualization
+            age_labels = [f'{i}-{i + 4}' for i in range(15, 95, 5)]
+            n_bins = len(age_labels)
+            age = self.data[age_col].to_numpy(dtype=float)
+            # Integer bin ids even for imputed (float) ages; NaN ages get -1 and are skipped
+            bin_id = np.where(np.isnan(age), -1, np.floor((age - 15) / 5)).astype(np.intp)
+            hours = self.data[hours_col].to_numpy(dtype=float)
+
+            # Mean hours per age group for each income bracket in a single pass
+            means, counts = _age_bin_means(bin_id, self._income_code, hours,
+                                           n_bins, len(self.income_levels))
+            mean_hours = {income_label: means[code]
+                          for code, income_label in enumerate(self.income_levels)
+                          if counts[code].any()}
+            observed = counts.any(axis=0)
+
+            age_hours = pd.DataFrame(mean_hours, index=age_labels)[observed]
 
             # Convert age groups to numeric for plotting
             x_positions = np.arange(len(age_hours))
@@ -207,19 +294,22 @@ class AdultDataAnalyzer:
     def _create_histogram(self, ax):
         """Create histogram for weekly work hours distribution"""
         try:
-            income_col = self.get_column_name('income')
-            hours_col = self.get_column_name('hours_per_week')
+            hours_col = self._c_hours_per_week
 
-            low_income_data = self.data[self.data[income_col] == '<=50K']
-            high_income_data = self.data[self.data[income_col] == '>50K']
+            hours = self.data[hours_col].to_numpy()
 
-            low_income_hours = low_income_data[hours_col] if not low_income_data.empty else []
-            high_income_hours = high_income_data[hours_col] if not high_income_data.empty else []
+            # Shared bin edges so both income groups are counted on the same grid
+            edges = np.histogram_bin_edges(hours, bins=25)
+            low_income_counts, _ = np.histogram(hours[self._income_mask('<=50K')], bins=edges)
+            high_income_counts, _ = np.histogram(hours[self._income_mask('>50K')], bins=edges)
 
-            ax.hist(low_income_hours, bins=25, alpha=0.7, label='Income <=50K',
-                    color=self.colors['<=50K'], edgecolor='black', linewidth=0.5)
-            ax.hist(high_income_hours, bins=25, alpha=0.7, label='Income >50K',
-                    color=self.colors['>50K'], edgecolor='black', linewidth=0.5)
+            # Draw the precomputed counts as weights, one sample per bin
+            ax.hist(edges[:-1], bins=edges, weights=low_income_counts, alpha=0.7,
+                    label='Income <=50K', color=self.colors['<=50K'],
+                    edgecolor='black', linewidth=0.5)
+            ax.hist(edges[:-1], bins=edges, weights=high_income_counts, alpha=0.7,
+                    label='Income >50K', color=self.colors['>50K'],
+                    edgecolor='black', linewidth=0.5)
 
             ax.set_title('Distribution of Weekly Work Hours by Income Group',
                          fontsize=14, fontweight='bold')
@@ -240,16 +330,25 @@ class AdultDataAnalyzer:
     def _create_grouped_bar_chart(self, ax):
         """Create grouped bar chart for education level by occupation"""
         try:
-            occupation_col = self.get_column_name('occupation')
-            income_col = self.get_column_name('income')
-            education_col = self.get_column_name('education_num')
-
-            education_occupation = self.data.groupby([occupation_col, income_col])[education_col].mean().unstack()
+            occupation_col = self._c_occupation
+            education_col = self._c_education_num
+
+            # Mean education per (occupation, income) cell from one flat bincount
+            occ_codes, occ_uniq = pd.factorize(self.data[occupation_col])
+            inc_codes, inc_uniq = self._income_code, self.income_levels
+            education = self.data[education_col].to_numpy(dtype=float)
+            valid = (occ_codes >= 0) & (inc_codes >= 0)
+            shape = (len(occ_uniq), len(inc_uniq))
+            cell = occ_codes[valid] * shape[1] + inc_codes[valid]
+            sums = np.bincount(cell, weights=education[valid], minlength=shape[0] * shape[1])
+            counts = np.bincount(cell, minlength=shape[0] * shape[1])
+            means = np.divide(sums, counts, out=np.full(sums.shape, np.nan),
+                              where=counts > 0).reshape(shape)
 
             # Sort by total education level for better visualization
-            education_occupation['total'] = education_occupation.mean(axis=1)
-            education_occupation = education_occupation.sort_values('total', ascending=False)
-            education_occupation = education_occupation.drop('total', axis=1)
+            order = np.argsort(-np.nanmean(means, axis=1), kind='stable')
+            education_occupation = pd.DataFrame(means[order], index=occ_uniq[order],
+                                                columns=inc_uniq)
 
             x_positions = np.arange(len(education_occupation))
             bar_width = 0.35
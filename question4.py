@@ -1,6 +1,5 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
 # Data
 experience = np.array([1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 13, 15, 16, 18, 20])
@@ -15,19 +14,31 @@ loc_labels = ['Remote', 'On-site', 'Hybrid']
 
 # Scatter plot
 plt.figure(figsize=(10, 6))
-for i in range(len(experience)):
-    plt.scatter(experience[i], salary[i],
-                color=colors[location[i]],
-                marker=markers[education[i]],
-                s=100, label=f'{loc_labels[location[i]]}' if i == location.tolist().index(location[i]) else "")
+for loc in range(3):
+    labelled = False
+    for edu in range(3):
+        mask = (location == loc) & (education == edu)
+        if not mask.any():
+            continue
+        # Label only the first group drawn per location so the legend lists it once
+        plt.scatter(experience[mask], salary[mask],
+                    color=colors[loc],
+                    marker=markers[edu],
+                    s=100, label=loc_labels[loc] if not labelled else "")
+        labelled = True
 
-# Fit and plot lines of best fit per location
+# Fit lines of best fit for all locations in one least-squares solve:
+# each location gets its own (intercept, slope) column pair in a block-diagonal design matrix
+rows = np.arange(len(experience))
+X = np.zeros((len(experience), 6))
+X[rows, 2 * location] = 1
+X[rows, 2 * location + 1] = experience
+beta, *_ = np.linalg.lstsq(X, salary, rcond=None)
+
+# Plot lines of best fit per location
 x_vals = np.linspace(min(experience), max(experience), 100)
 for loc in range(3):  # 0: Remote, 1: On-site, 2: Hybrid
-    mask = location == loc
-    model = LinearRegression()
-    model.fit(experience[mask].reshape(-1, 1), salary[mask])
-    y_pred = model.predict(x_vals.reshape(-1, 1))
+    y_pred = beta[2 * loc] + beta[2 * loc + 1] * x_vals
     plt.plot(x_vals, y_pred, color=colors[loc], linestyle='--', label=f'{loc_labels[loc]} Fit')
 
 plt.title("Experience vs Salary by Education and Location")